@@ -157,6 +157,8 @@ namespace UnityMCP
                 Debug.Log("[UnityMCP] Client connected.");
 
                 byte[] receiveBuffer = new byte[1024 * 4];
+                MemoryStream messageBuffer = new MemoryStream();
+                SemaphoreSlim sendLock = new SemaphoreSlim(1, 1);
 
                 while (webSocket.State == WebSocketState.Open)
                 {
@@ -170,12 +172,17 @@ namespace UnityMCP
                     }
                     else
                     {
-                        string message = Encoding.UTF8.GetString(receiveBuffer, 0, result.Count);
+                        // Messages larger than the buffer (scripts, batches) arrive in several chunks
+                        messageBuffer.Write(receiveBuffer, 0, result.Count);
+                        if (!result.EndOfMessage) continue;
+
+                        string message = Encoding.UTF8.GetString(messageBuffer.GetBuffer(), 0, (int)messageBuffer.Length);
+                        messageBuffer.SetLength(0);
                         // Handle message on Main Thread
                         EditorApplication.delayCall += () => 
                         {
                             string response = HandleMessage(message);
-                            SendMessage(webSocket, response);
+                            SendMessage(webSocket, sendLock, response);
                         };
                     }
                 }
@@ -187,26 +194,74 @@ namespace UnityMCP
             }
         }
 
-        private static async void SendMessage(WebSocket socket, string message)
+        private static async void SendMessage(WebSocket socket, SemaphoreSlim sendLock, string message)
         {
-            if (socket.State != WebSocketState.Open) return;
             byte[] buffer = Encoding.UTF8.GetBytes(message);
-            await socket.SendAsync(new ArraySegment<byte>(buffer), WebSocketMessageType.Text, true, CancellationToken.None);
+
+            // The Python server pipelines commands, so replies can overlap; a WebSocket allows only one SendAsync at a time
+            await sendLock.WaitAsync();
+            try
+            {
+                if (socket.State != WebSocketState.Open) return;
+                await socket.SendAsync(new ArraySegment<byte>(buffer), WebSocketMessageType.Text, true, CancellationToken.None);
+            }
+            finally
+            {
+                sendLock.Release();
+            }
         }
 
         // --- REFLECTION BASED COMMAND HANDLING ---
 
         private static string HandleMessage(string json)
+        {
+            // A JSON array is a batch of commands coalesced by the Python server
+            if (json.TrimStart().StartsWith("[")) return HandleBatch(json);
+
+            try
+            {
+                return HandleCommand(JsonUtility.FromJson<CommandData>(json));
+            }
+            catch (Exception e)
+            {
+                return ErrorJson(e.Message);
+            }
+        }
+
+        private static string HandleBatch(string json)
+        {
+            CommandBatch batch;
+            try
+            {
+                // JsonUtility cannot parse a top-level array, so wrap it in an object
+                batch = JsonUtility.FromJson<CommandBatch>($"{{\"commands\":{json}}}");
+            }
+            catch (Exception e)
+            {
+                return ErrorJson(e.Message);
+            }
+            if (batch == null || batch.commands == null) return ErrorJson("Invalid JSON");
+
+            // Each reply carries its command's id, so the Python server can match them up
+            StringBuilder sb = new StringBuilder("[");
+            for (int i = 0; i < batch.commands.Length; i++)
+            {
+                if (i > 0) sb.Append(',');
+                sb.Append(HandleCommand(batch.commands[i]));
+            }
+            return sb.Append(']').ToString();
+        }
+
+        private static string HandleCommand(CommandData data)
         {
             try
             {
-                CommandData data = JsonUtility.FromJson<CommandData>(json);
-                if (data == null || string.IsNullOrEmpty(data.method)) return ErrorJson("Invalid JSON");
+                if (data == null || string.IsNullOrEmpty(data.method)) return ErrorJson("Invalid JSON", data?.id ?? 0);
 
                 // Find method in this class
                 MethodInfo method = typeof(UnityMCPServer).GetMethod(data.method, BindingFlags.Static | BindingFlags.Public | BindingFlags.NonPublic);
 
-                if (method == null) return ErrorJson($"Method '{data.method}' not found.");
+                if (method == null) return ErrorJson($"Method '{data.method}' not found.", data.id);
 
                 // Invoke method
                 // Note: For simplicity, we assume methods take the raw CommandData or specific params.
@@ -214,16 +269,21 @@ namespace UnityMCP
                 // Here we pass the full data object for manual extraction inside methods.
                 object result = method.Invoke(null, new object[] { data });
 
-                return SuccessJson(result?.ToString());
+                return SuccessJson(result?.ToString(), data.id);
             }
             catch (Exception e)
             {
-                return ErrorJson(e.InnerException?.Message ?? e.Message);
+                return ErrorJson(e.InnerException?.Message ?? e.Message, data.id);
             }
         }
 
         // --- EXPOSED METHODS (API) ---
 
+        private static string Ping(CommandData data)
+        {
+            return "Pong";
+        }
+
         private static string CreateObject(CommandData data)
         {
             string name = "New Object";
@@ -393,7 +453,7 @@ namespace UnityMCP
 
         private static string SetPlayMode(CommandData data)
         {
-            bool play = data.param_string.ToLower() == "true";
+            bool play = string.Equals(data.param_string, "true", StringComparison.OrdinalIgnoreCase);
             EditorApplication.isPlaying = play;
             return $"Play mode set to {play}";
         }
@@ -551,15 +611,42 @@ namespace UnityMCP
 
         // --- HELPERS ---
 
-        private static string ErrorJson(string msg) => $"{{\"status\":\"error\",\"message\":\"{msg}\"}}";
-        private static string SuccessJson(string result) => $"{{\"status\":\"success\",\"result\":\"{result}\"}}";
+        // The id echoes the command's correlation id and comes first so the Python server can read it cheaply
+        private static string ErrorJson(string msg, int id = 0) => $"{{\"id\":{id},\"status\":\"error\",\"message\":\"{EscapeJson(msg)}\"}}";
+        private static string SuccessJson(string result, int id) => $"{{\"id\":{id},\"status\":\"success\",\"result\":\"{EscapeJson(result)}\"}}";
+
+        // Results are often multi-line (hierarchy, console, inspector), which is invalid inside a raw JSON string
+        private static string EscapeJson(string s)
+        {
+            if (string.IsNullOrEmpty(s)) return "";
+
+            StringBuilder sb = new StringBuilder(s.Length);
+            foreach (char c in s)
+            {
+                switch (c)
+                {
+                    case '"': sb.Append("\\\""); break;
+                    case '\\': sb.Append("\\\\"); break;
+                    case '\n': sb.Append("\\n"); break;
+                    case '\r': sb.Append("\\r"); break;
+                    case '\t': sb.Append("\\t"); break;
+                    default:
+                        if (c < ' ') sb.Append($"\\u{(int)c:x4}");
+                        else sb.Append(c);
+                        break;
+                }
+            }
+            return sb.ToString();
+        }
     }
 
     [Serializable]
     public class CommandData
     {
         public string method;
-        // Flattened params for JsonUtility simplicity
+        public int id; // Correlation id, echoed back in the reply
+        // Flattened params for JsonUtility simplicity.
+        // The Python server omits params it does not use, so any of these may be left at their defaults.
         public string param_name;
         public string param_string; // Generic string param (e.g. component name)
         public string param_second; // Extra string param (e.g. property name)
@@ -569,6 +656,12 @@ namespace UnityMCP
         public Vector3Data param_scale;
     }
 
+    [Serializable]
+    public class CommandBatch
+    {
+        public CommandData[] commands;
+    }
+
     [Serializable]
     public class Vector3Data
     {
@@ -1,75 +1,411 @@
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+import anyio
 import asyncio
+import contextvars
+import itertools
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Union
 import websockets
-import json
+from websockets.exceptions import ConnectionClosed, WebSocketException
+import orjson
+
+UNITY_WS_URL = "ws://localhost:8080"
+
+# Commands queued while a batch is being sent go out together as one JSON-array frame.
+# Older Unity packages only understand single objects, so batching is opt-in.
+UNITY_WS_BATCH = os.environ.get("UNITY_MCP_BATCH") == "1"
+MAX_BATCH_BYTES = 64 * 1024
+
+# Seconds to wait for Unity's reply before giving up on a command
+UNITY_TIMEOUT = 10
+
+# Unity echoes each command's id first, so most replies look like {"id":7,"status":"success","result":"Done"}
+# and the result can be sliced out without a full JSON parse. That only beats orjson on large frames
+# (screenshots, big hierarchies); below FAST_PATH_MIN_BYTES orjson is faster.
+FAST_PATH_MIN_BYTES = 4096
+_ID_PREFIX = b'{"id":'
+_SUCCESS_MARK = b',"status":"success","result":"'
+_SUCCESS_END = b'"}'
+# The mark must follow the id closely; this bounds the search for it
+_SUCCESS_MARK_LIMIT = len(_ID_PREFIX) + 20 + len(_SUCCESS_MARK)
+
+class UnityProtocolError(Exception):
+    """A reply from Unity that can't be read or matched to the command it answers."""
+
+def _with_id(message: bytes, command_id: int) -> bytes:
+    """Appends the correlation id to an encoded command object."""
+    return b'%s,"id":%d}' % (message[:-1], command_id)
+
+def _frame(batch: list) -> bytes:
+    """Builds the frame for a batch of queued (id, message, future) items: the message itself, or a JSON array of them."""
+    if len(batch) == 1:
+        return batch[0][1]
+    return b"[" + b",".join(message for _, message, _ in batch) + b"]"
+
+def _format_response(data: dict) -> str:
+    """Turns a parsed Unity response into the tool's result string."""
+    if data.get("status") == "success":
+        return data.get("result") or "Success"
+    else:
+        return f"Error: {data.get('message')}"
+
+def _parse_frame(frame: bytes) -> list:
+    """Parses a frame from Unity (one reply or a batch of them) into (id, result string) pairs."""
+    if len(frame) >= FAST_PATH_MIN_BYTES and frame.startswith(_ID_PREFIX) and frame.endswith(_SUCCESS_END):
+        mark = frame.find(_SUCCESS_MARK, len(_ID_PREFIX), _SUCCESS_MARK_LIMIT)
+        if mark > 0:
+            command_id = frame[len(_ID_PREFIX):mark]
+            start, end = mark + len(_SUCCESS_MARK), len(frame) - len(_SUCCESS_END)
+            # Unity escapes quotes and control characters, so a result without a backslash is the literal text
+            if command_id.isdigit() and frame.find(b"\\", start, end) == -1:
+                try:
+                    # Decode straight from a view of the frame instead of copying the slice first
+                    return [(int(command_id), str(memoryview(frame)[start:end], "utf-8"))]
+                except UnicodeDecodeError as e:
+                    raise UnityProtocolError(f"Unreadable reply: {e}") from e
+
+    try:
+        data = orjson.loads(frame)
+    except orjson.JSONDecodeError as e:
+        raise UnityProtocolError(f"Unreadable reply: {e}") from e
+
+    replies = data if isinstance(data, list) else [data]
+    if not all(isinstance(reply, dict) for reply in replies):
+        raise UnityProtocolError("Reply is not a JSON object")
+    return [(reply.get("id"), _format_response(reply)) for reply in replies]
+
+class UnityConnection:
+    """A WebSocket connection to Unity, opened on first use and shared by every tool call.
+    A writer task sends queued commands and a reader task hands each reply to its caller by id,
+    so commands don't wait for each other's replies.
+    """
+
+    def __init__(self, **connect_options):
+        self._connect_options = connect_options
+        self._ws = None
+        # Futures awaiting a reply on the current connection, by command id
+        self._pending = {}
+        self._ids = itertools.count(1)
+        self._lock = asyncio.Lock()
+        self._queue = asyncio.Queue()
+        self._writer_task = None
+        self._reader_task = None
+
+    async def get_ws(self):
+        """Returns the open connection, connecting if needed."""
+        async with self._lock:
+            if self._ws is None:
+                self._ws = await websockets.connect(UNITY_WS_URL, ping_interval=20, max_queue=None,
+                                                    **self._connect_options)
+                self._pending = {}
+                self._reader_task = asyncio.create_task(self._reader(self._ws, self._pending))
+            return self._ws
+
+    async def open(self):
+        """Connects ahead of the first command. If Unity isn't reachable yet, tools report it when called."""
+        try:
+            await self.get_ws()
+        except (OSError, WebSocketException):
+            pass
+
+    async def close(self):
+        """Stops the writer task and closes the connection; the reader fails any commands still in flight."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        async with self._lock:
+            if self._ws is not None:
+                await self._ws.close()
+                self._ws = None
+
+    def _drop(self, ws):
+        """Forgets a dead connection so the next command reconnects."""
+        if self._ws is ws:
+            self._ws = None
+
+    @staticmethod
+    def _fail(pending: dict, error: Exception):
+        """Fails every command still waiting for a reply."""
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(error)
+        pending.clear()
+
+    async def _reader(self, ws, pending: dict):
+        """Resolves pending futures with Unity's replies until the connection closes."""
+        try:
+            while True:
+                # Raw bytes: orjson validates UTF-8 while parsing, so websockets needn't decode the frame first
+                frame = await ws.recv(decode=False)
+                try:
+                    replies = _parse_frame(frame)
+                except UnityProtocolError as e:
+                    # The frame can't tell us which command it answers
+                    self._fail(pending, e)
+                    continue
+
+                for command_id, result in replies:
+                    if command_id:
+                        # No match means a late reply to a command that already timed out
+                        fut = pending.pop(command_id, None)
+                    elif len(pending) == 1:
+                        # Unity couldn't read the command (id 0), or is an older package that sends no id;
+                        # with a single command in flight, the reply must be for that command
+                        _, fut = pending.popitem()
+                    else:
+                        self._fail(pending, UnityProtocolError(f"Reply without a command id: {result}"))
+                        continue
+                    if fut is not None and not fut.done():
+                        fut.set_result(result)
+        except ConnectionClosed as e:
+            self._drop(ws)
+            self._fail(pending, e)
+        except Exception as e:
+            # Anything else leaves replies unmatched, so start over on a fresh connection
+            self._drop(ws)
+            self._fail(pending, UnityProtocolError(str(e)))
+            await ws.close()
+
+    async def _send(self, batch: list):
+        """Registers the batch's futures and sends it.
+        If the connection was dropped (e.g. after a domain reload) it is reopened and retried once.
+        """
+        for attempt in range(2):
+            if attempt:
+                # The reader may have failed some of these while the send waited on the closing socket;
+                # those callers were told the command failed, so Unity must not get it
+                batch = [item for item in batch if not item[2].done()]
+                if not batch:
+                    return
+            ws = await self.get_ws()
+            pending = self._pending
+            for command_id, _, fut in batch:
+                pending[command_id] = fut
+            try:
+                await ws.send(_frame(batch))
+                return
+            except ConnectionClosed:
+                for command_id, _, _ in batch:
+                    pending.pop(command_id, None)
+                self._drop(ws)
+                if attempt:
+                    raise
+
+    async def _writer(self):
+        """Sends queued commands to Unity without waiting for their replies."""
+        while True:
+            batch = [await self._queue.get()]
+            if UNITY_WS_BATCH:
+                size = len(batch[0][1])
+                while not self._queue.empty() and size < MAX_BATCH_BYTES:
+                    item = self._queue.get_nowait()
+                    batch.append(item)
+                    size += len(item[1])
+
+            # Skip commands whose caller timed out or was cancelled while they were queued;
+            # Unity would otherwise apply a change the caller was told had failed
+            batch = [item for item in batch if not item[2].done()]
+            if not batch:
+                continue
+
+            try:
+                await self._send(batch)
+            except Exception as e:
+                for _, _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+
+    async def request(self, message: bytes) -> str:
+        """Queues an encoded command and returns the tool's result string."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer())
+
+        command_id = next(self._ids)
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((command_id, _with_id(message, command_id), fut))
+        try:
+            return await asyncio.wait_for(fut, timeout=UNITY_TIMEOUT)
+        finally:
+            self._pending.pop(command_id, None)
+
+# Unity's HttpListener never negotiates permessage-deflate, so compression isn't offered.
+# max_size leaves room for large screenshot and hierarchy replies.
+_unity = UnityConnection(compression=None, max_size=16 * 1024 * 1024)
+
+# Number of MCP client sessions currently holding the connection open
+_sessions = 0
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Opens the Unity connection when an MCP session starts, so the handshake isn't paid by the first tool call,
+    and closes it once the last session ends.
+    """
+    global _sessions
+    _sessions += 1
+    await _unity.open()
+    try:
+        yield
+    finally:
+        _sessions -= 1
+        if _sessions == 0:
+            await _unity.close()
 
 # Initialize the MCP Server
-mcp = FastMCP("UnityMCP")
+mcp = FastMCP("UnityMCP", lifespan=lifespan)
 
-UNITY_WS_URL = "ws://localhost:8080"
+@dataclass(slots=True)
+class Command:
+    """A command for Unity, with params flattened for simple JsonUtility parsing."""
+    method: str
+    param_name: str = ""
+    param_string: str = ""
+    param_second: str = ""
+    param_value: Optional[str] = None
+    param_pos: Optional[dict] = None
+    param_rot: Optional[dict] = None
+    param_scale: Optional[dict] = None
+
+    def to_bytes(self) -> bytes:
+        """Encodes the command. Only params that are set are sent; Unity leaves missing fields at their defaults."""
+        payload = {"method": self.method}
+        if self.param_name:
+            payload["param_name"] = self.param_name
+        if self.param_string:
+            payload["param_string"] = self.param_string
+        if self.param_second:
+            payload["param_second"] = self.param_second
+        if self.param_value is not None:
+            payload["param_value"] = self.param_value
+        if self.param_pos is not None:
+            payload["param_pos"] = self.param_pos
+        if self.param_rot is not None:
+            payload["param_rot"] = self.param_rot
+        if self.param_scale is not None:
+            payload["param_scale"] = self.param_scale
+        return orjson.dumps(payload)
+
+class EncodedCommand(NamedTuple):
+    """A command encoded once, for the parameterless tools. Immutable, so it can be shared by every call."""
+    method: str
+    payload: bytes
+
+    @classmethod
+    def of(cls, method: str) -> "EncodedCommand":
+        """Encodes a command that takes no params."""
+        return cls(method, Command(method).to_bytes())
+
+    def to_bytes(self) -> bytes:
+        """Returns the payload encoded at construction."""
+        return self.payload
+
+# Commands that only read the editor's state. Anything else is treated as a change: it clears the result cache,
+# and makes later reads in the same batch_tools call skip the cache.
+READ_ONLY_METHODS = frozenset({"Ping", "FindObject", "GetHierarchy", "ListAssets", "ReadConsole", "IsCompiling",
+                               "GetSelection", "InspectObject", "GetScreenshot"})
+
+# Agents often look at the scene, decide, and look again within moments. Results of these read-only commands
+# are reused for CACHE_TTL seconds, and any other command clears them.
+CACHEABLE_METHODS = frozenset({"GetHierarchy", "ListAssets", "IsCompiling", "ReadConsole", "GetSelection", "InspectObject"})
+CACHE_TTL = 0.25
+CACHE_MAXSIZE = 256
+
+# Encoded payload -> (expiry time, result)
+_cache = {}
+# Bumped whenever a mutating command finishes. A read only stores its result if the generation is
+# unchanged since it was issued; otherwise Unity may have run it before the mutation.
+_cache_generation = 0
+
+# Methods sent so far by the batch_tools call a command belongs to, if any
+_batch_methods = contextvars.ContextVar("batch_methods", default=None)
 
-async def send_ws_command(method: str, **kwargs) -> str:
+async def send_ws_command(cmd: Union[Command, EncodedCommand]) -> str:
     """Helper to send WebSocket commands to Unity."""
-    payload = {
-        "method": method,
-        # Flatten params for simple Unity JsonUtility parsing
-        "param_name": kwargs.get("name", ""),
-        "param_string": kwargs.get("string_param", ""),
-        "param_second": kwargs.get("second_param", ""),
-        "param_value": kwargs.get("value_param", ""),
-        "param_pos": kwargs.get("position", None),
-        "param_rot": kwargs.get("rotation", None),
-        "param_scale": kwargs.get("scale", None)
-    }
-    
+    global _cache_generation
+    payload = cmd.to_bytes()
+    read_only = cmd.method in READ_ONLY_METHODS
+    # A read in a batch must see the effect of any change sent before it in the same batch
+    batch = _batch_methods.get()
+    after_mutation = batch is not None and not READ_ONLY_METHODS.issuperset(batch)
+    if batch is not None:
+        batch.append(cmd.method)
+
+    cacheable = cmd.method in CACHEABLE_METHODS
+    if cacheable and not after_mutation:
+        cached = _cache.get(payload)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+    generation = _cache_generation
     try:
-        async with websockets.connect(UNITY_WS_URL) as websocket:
-            await websocket.send(json.dumps(payload))
-            response = await websocket.recv()
-            
-            # Parse response
-            data = json.loads(response)
-            if data.get("status") == "success":
-                return data.get("result", "Success")
-            else:
-                return f"Error: {data.get('message')}"
-                
-    except ConnectionRefusedError:
+        # Unity decodes binary and text frames alike, so the encoded bytes go out as-is
+        result = await _unity.request(payload)
+    except asyncio.TimeoutError:
+        return f"Unity did not respond within {UNITY_TIMEOUT}s. Is the Editor busy (e.g. compiling)?"
+    except ConnectionClosed:
+        return "The connection to Unity was closed. Please retry."
+    except WebSocketException:
+        # The handshake was rejected, e.g. another server answered on Unity's port
+        return f"Unity did not accept a WebSocket connection at {UNITY_WS_URL}. Is the MCP server running in Unity?"
+    except UnityProtocolError as e:
+        return f"Unexpected reply from Unity: {e}"
+    except OSError:
+        # ConnectionRefusedError, or several refused attempts when localhost resolves to both IPv4 and IPv6
         return "Could not connect to Unity. Is the project open?"
-    except Exception as e:
-        return f"WebSocket Error: {str(e)}"
+    finally:
+        # Even a failed or timed-out command may have changed the scene
+        if not read_only:
+            _cache_generation += 1
+            _cache.clear()
+
+    if cacheable and generation == _cache_generation and not result.startswith("Error: "):
+        if len(_cache) >= CACHE_MAXSIZE:
+            del _cache[next(iter(_cache))]
+        _cache[payload] = (time.monotonic() + CACHE_TTL, result)
+    return result
+
+# The parameterless (and most frequently called) commands, encoded once at import
+_PING = EncodedCommand.of("Ping")
+_GET_HIERARCHY = EncodedCommand.of("GetHierarchy")
+_READ_CONSOLE = EncodedCommand.of("ReadConsole")
+_IS_COMPILING = EncodedCommand.of("IsCompiling")
+_GET_SELECTION = EncodedCommand.of("GetSelection")
+_GET_SCREENSHOT = EncodedCommand.of("GetScreenshot")
+
+# String form of bool params, as Unity's handlers expect them
+_BOOL_STR = {True: "true", False: "false"}
 
 @mcp.tool()
 async def ping_unity() -> str:
     """Checks if the Unity Editor is connected via WebSocket."""
-    # Simple HTTP ping fallback is still available in Unity server, but let's try WS
-    try:
-        async with websockets.connect(UNITY_WS_URL) as websocket:
-            return "Connected to Unity WebSocket Server!"
-    except:
-        return "Failed to connect to Unity."
+    # Simple HTTP ping fallback is still available in Unity server, but a WS round trip also checks the main thread
+    result = await send_ws_command(_PING)
+    return "Connected to Unity WebSocket Server!" if result == "Pong" else result
 
 @mcp.tool()
 async def create_game_object(name: str, position_x: float = 0, position_y: float = 0, position_z: float = 0) -> str:
     """Creates a new GameObject in the Unity Scene."""
-    return await send_ws_command("CreateObject", 
-                               name=name, 
-                               position={"x": position_x, "y": position_y, "z": position_z})
+    return await send_ws_command(Command("CreateObject",
+                                         param_name=name,
+                                         param_pos={"x": position_x, "y": position_y, "z": position_z}))
 
 @mcp.tool()
 async def delete_object(name: str) -> str:
     """Deletes a GameObject by name."""
-    return await send_ws_command("DeleteObject", name=name)
+    return await send_ws_command(Command("DeleteObject", param_name=name))
 
 @mcp.tool()
 async def add_component(object_name: str, component_name: str) -> str:
     """Adds a component to a GameObject. (e.g. Rigidbody, BoxCollider)"""
-    return await send_ws_command("AddComponent", name=object_name, string_param=component_name)
+    return await send_ws_command(Command("AddComponent", param_name=object_name, param_string=component_name))
 
 @mcp.tool()
 async def find_object(name: str) -> str:
     """Finds a GameObject and returns its details (Transform, Components)."""
-    return await send_ws_command("FindObject", name=name)
+    return await send_ws_command(Command("FindObject", param_name=name))
 
 @mcp.tool()
 async def modify_transform(name: str, 
@@ -82,12 +418,12 @@ async def modify_transform(name: str,
     rot = {"x": rot_x, "y": rot_y, "z": rot_z} if rot_x is not None else None
     scale = {"x": scale_x, "y": scale_y, "z": scale_z} if scale_x is not None else None
 
-    return await send_ws_command("ModifyTransform", name=name, position=pos, rotation=rot, scale=scale)
+    return await send_ws_command(Command("ModifyTransform", param_name=name, param_pos=pos, param_rot=rot, param_scale=scale))
 
 @mcp.tool()
 async def get_hierarchy() -> str:
     """Gets the current scene hierarchy."""
-    return await send_ws_command("GetHierarchy")
+    return await send_ws_command(_GET_HIERARCHY)
 
 @mcp.tool()
 async def create_script(script_name: str, content: str) -> str:
@@ -96,59 +432,59 @@ async def create_script(script_name: str, content: str) -> str:
         script_name: Name of the class/file (e.g. 'MyScript')
         content: The full C# code content.
     """
-    return await send_ws_command("CreateScript", name=script_name, string_param=content)
+    return await send_ws_command(Command("CreateScript", param_name=script_name, param_string=content))
 
 @mcp.tool()
 async def create_material(material_name: str, r: float = 1, g: float = 1, b: float = 1) -> str:
     """Creates a new Material in Assets/Materials/Generated with a specific color."""
-    return await send_ws_command("CreateMaterial", name=material_name, position={"x":r, "y":g, "z":b})
+    return await send_ws_command(Command("CreateMaterial", param_name=material_name, param_pos={"x":r, "y":g, "z":b}))
 
 @mcp.tool()
 async def list_assets(path: str = "Assets") -> str:
     """Lists files and directories in the project."""
-    return await send_ws_command("ListAssets", string_param=path)
+    return await send_ws_command(Command("ListAssets", param_string=path))
 
 @mcp.tool()
 async def read_console() -> str:
     """Reads the last 100 log messages from the Unity Console."""
-    return await send_ws_command("ReadConsole")
+    return await send_ws_command(_READ_CONSOLE)
 
 @mcp.tool()
 async def set_play_mode(active: bool) -> str:
     """Enables or disables Play Mode in the Unity Editor."""
-    return await send_ws_command("SetPlayMode", string_param=str(active).lower())
+    return await send_ws_command(Command("SetPlayMode", param_string=_BOOL_STR[active]))
 
 @mcp.tool()
 async def execute_menu_item(menu_path: str) -> str:
     """Executes a Unity Editor menu item (e.g. 'Assets/Refresh', 'Window/General/Game')."""
-    return await send_ws_command("ExecuteMenuItem", string_param=menu_path)
+    return await send_ws_command(Command("ExecuteMenuItem", param_string=menu_path))
 
 @mcp.tool()
 async def is_compiling() -> str:
     """Checks if the Unity Editor is currently compiling scripts."""
-    return await send_ws_command("IsCompiling")
+    return await send_ws_command(_IS_COMPILING)
 
 @mcp.tool()
 async def get_selection() -> str:
     """Gets the name of the currently selected GameObject in the Editor."""
-    return await send_ws_command("GetSelection")
+    return await send_ws_command(_GET_SELECTION)
 
 @mcp.tool()
 async def set_selection(name: str) -> str:
     """Selects a GameObject in the Editor by name."""
-    return await send_ws_command("SetSelection", name=name)
+    return await send_ws_command(Command("SetSelection", param_name=name))
 
 @mcp.tool()
 async def inspect_object(name: str) -> str:
     """Inspects a GameObject, listing all components and their public fields/properties."""
-    return await send_ws_command("InspectObject", name=name)
+    return await send_ws_command(Command("InspectObject", param_name=name))
 
 @mcp.tool()
 async def get_screenshot() -> str:
     """Captures a screenshot from the Main Camera and returns it as a Base64 encoded JPG string.
     Useful for 'seeing' the current state of the scene.
     """
-    return await send_ws_command("GetScreenshot")
+    return await send_ws_command(_GET_SCREENSHOT)
 
 @mcp.tool()
 async def set_component_property(object_name: str, component_name: str, property_name: str, value: str) -> str:
@@ -159,12 +495,51 @@ async def set_component_property(object_name: str, component_name: str, property
         property_name: Name of the field/property (e.g. 'color', 'mass', 'intensity').
         value: The new value as a string (e.g. '10', '5.5', 'true').
     """
-    return await send_ws_command("SetComponentProperty", 
-                               name=object_name, 
-                               string_param=component_name, 
-                               second_param=property_name, 
-                               value_param=value)
+    return await send_ws_command(Command("SetComponentProperty",
+                                         param_name=object_name,
+                                         param_string=component_name,
+                                         param_second=property_name,
+                                         param_value=value))
+
+async def _run_batched(command) -> str:
+    """Runs one entry of a batch_tools call through the registered tool, so its arguments are validated."""
+    if not isinstance(command, dict) or not isinstance(command.get("args", {}), dict):
+        raise ToolError('Each command must look like {"tool": <tool name>, "args": {<tool arguments>}}')
+    name = command.get("tool")
+    if name == "batch_tools":
+        raise ToolError("batch_tools cannot be nested")
+    result = await mcp.call_tool(name, command.get("args", {}))
+    if isinstance(result, tuple):
+        # (content, structured output) for tools with an output schema
+        result = result[0]
+    return "".join(block.text for block in getattr(result, "content", result) if hasattr(block, "text"))
+
+@mcp.tool()
+async def batch_tools(commands: list) -> str:
+    """Runs several tools in one call and returns their results as a JSON list, one per command.
+    The commands are pipelined to Unity in list order and Unity runs them in that order, so
+    e.g. create, then select, then inspect sees the new object.
+    Args:
+        commands: List of {"tool": <tool name>, "args": {<tool arguments>}},
+            e.g. [{"tool": "create_game_object", "args": {"name": "Cube"}}, {"tool": "set_selection", "args": {"name": "Cube"}}]
+    """
+    # gather starts the entries in list order, and each queues its command before it first waits,
+    # so they reach send_ws_command, the writer's queue and the one socket in that order
+    token = _batch_methods.set([])
+    try:
+        results = await asyncio.gather(*(_run_batched(command) for command in commands), return_exceptions=True)
+    finally:
+        _batch_methods.reset(token)
+    return orjson.dumps([f"Error: {result}" if isinstance(result, Exception) else result
+                         for result in results]).decode()
 
 if __name__ == "__main__":
     # Run as SSE server for better compatibility with VS Code / Cursor
-    mcp.run(transport="sse")
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        # uvloop has no Windows build, so there we stay on asyncio's default loop
+        mcp.run(transport="sse")
+    else:
+        # uvloop is a faster drop-in event loop. anyio starts it directly, since uvloop.install() is deprecated from Python 3.12
+        anyio.run(mcp.run_sse_async, backend_options={"use_uvloop": True})